@@ -152,26 +152,8 @@ class dtype(Enum):
 
         # TODO: Ideally implemented with match statement but need to wait for Py39 EoL
         if isinstance(t, torch.dtype):
-            if t == torch.uint8:
-                return dtype.u8
-            elif t == torch.int8:
-                return dtype.i8
-            elif t == torch.long:
-                return dtype.i64
-            elif t == torch.int32:
-                return dtype.i32
-            elif t == torch.float8_e4m3fn:
-                return dtype.f8
-            elif t == torch.half:
-                return dtype.f16
-            elif t == torch.float:
-                return dtype.f32
-            elif t == torch.float64:
-                return dtype.f64
-            elif t == torch.bool:
-                return dtype.b
-            elif t == torch.bfloat16:
-                return dtype.bf16
+            if t in _TORCH_TO_DTYPE:
+                return _TORCH_TO_DTYPE[t]
             elif use_default:
                 logging.warning(
                     f"Given dtype that does not have direct mapping to Torch-TensorRT supported types ({t}), defaulting to torch_tensorrt.dtype.float"
@@ -508,6 +490,21 @@ class dtype(Enum):
     int = i32
 
 
+# Lookup table for the most common translation, used by dtype._from and dtype.__eq__
+_TORCH_TO_DTYPE = {
+    torch.uint8: dtype.u8,
+    torch.int8: dtype.i8,
+    torch.long: dtype.i64,
+    torch.int32: dtype.i32,
+    torch.float8_e4m3fn: dtype.f8,
+    torch.half: dtype.f16,
+    torch.float: dtype.f32,
+    torch.float64: dtype.f64,
+    torch.bool: dtype.b,
+    torch.bfloat16: dtype.bf16,
+}
+
+
 class memory_format(Enum):
     """"""
 
@@ -1,8 +1,10 @@
+import functools
 from typing import Any
 
 import torch
 
 
+@functools.lru_cache(maxsize=1)
 def sanitized_torch_version() -> Any:
     return (
         torch.__version__
@@ -27,12 +27,15 @@ USE_PYTHON_RUNTIME = False
 USE_FAST_PARTITIONER = True
 ENABLE_EXPERIMENTAL_DECOMPOSITIONS = False
 MAKE_REFITABLE = False
+VALIDATE_REFIT = False
 REQUIRE_FULL_COMPILATION = False
 DRYRUN = False
 HARDWARE_COMPATIBLE = False
 SUPPORTED_KERNEL_PRECISIONS = {dtype.f32, dtype.f16, dtype.bf16, dtype.i8, dtype.f8}
 TIMING_CACHE_PATH = os.path.join(tempfile.gettempdir(), "timing_cache.bin")
 LAZY_ENGINE_INIT = False
+ENGINE_CACHE_DIR = None
+ENGINE_CACHE_SIZE = 5368709120
 
 
 def default_device() -> Device:
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import fields
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import tensorrt as trt
+import torch
+from torch_tensorrt._Input import Input
+from torch_tensorrt._version import __version__
+from torch_tensorrt.dynamo._settings import CompilationSettings
+
+logger = logging.getLogger(__name__)
+
+# Settings which control the cache itself and have no influence on the built engine
+_CACHE_INDEPENDENT_SETTINGS = {
+    "debug",
+    "dryrun",
+    "engine_cache_dir",
+    "engine_cache_size",
+    "lazy_engine_init",
+    "timing_cache_path",
+    "use_python_runtime",
+    "validate_refit",
+}
+
+# Cached entries are (serialized_engine, input_names, output_names, weight_name_map, input_signature)
+EngineCacheEntry = Tuple[bytes, List[str], List[str], Optional[dict[Any, Any]], Any]
+
+
+def input_signature(inputs: Sequence[Input]) -> Tuple[Any, ...]:
+    """Summarizes the shape profile of a set of inputs
+
+    Dynamic inputs are described by their full (min, opt, max) shape profile,
+    so an engine is only reused when its optimization profile matches exactly
+    """
+    return tuple(
+        (
+            str(i.shape_mode),
+            repr(i.shape),
+            str(i.dtype),
+            str(i.format),
+            i.is_shape_tensor,
+        )
+        for i in inputs
+    )
+
+
+def get_hash(
+    gm: torch.fx.GraphModule,
+    inputs: Sequence[Input],
+    settings: CompilationSettings,
+) -> str:
+    """Computes a content-addressed key for the engine built from a graph
+
+    The key covers the graph code, its submodules, the weights it references,
+    the input shape profiles, the Torch-TensorRT/TensorRT/Torch/CUDA versions,
+    the GPU compute capability and all compilation settings which influence
+    the built engine
+    """
+    hasher = hashlib.sha256()
+    hasher.update(gm.code.encode())
+
+    # gm.code names submodules only by attribute, so their configuration
+    # (e.g. Softmax(dim=1) vs Softmax(dim=2)) and child graphs must be hashed
+    for name, submod in gm.named_modules():
+        hasher.update(f"{name}:{type(submod).__qualname__}:{submod!r}".encode())
+        if submod is not gm and isinstance(submod, torch.fx.GraphModule):
+            hasher.update(submod.code.encode())
+
+    # Weights are embedded in the engine, so they must be part of the key
+    constants = dict(gm.state_dict())
+    for node in gm.graph.nodes:
+        if node.op == "get_attr" and node.target not in constants:
+            attr = gm
+            for atom in node.target.split("."):
+                attr = getattr(attr, atom)
+            if isinstance(attr, torch.Tensor):
+                constants[node.target] = attr
+
+    for name in sorted(constants):
+        tensor = constants[name].detach()
+        hasher.update(f"{name}:{tuple(tensor.shape)}:{tensor.dtype}".encode())
+        hasher.update(
+            tensor.cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes()
+        )
+
+    hasher.update(repr(input_signature(inputs)).encode())
+    hasher.update(
+        f"torch_tensorrt:{__version__};trt:{trt.__version__};"
+        f"torch:{torch.__version__};cuda:{torch.version.cuda}".encode()
+    )
+    if torch.cuda.is_available():
+        hasher.update(
+            repr(torch.cuda.get_device_capability(settings.device.gpu_id)).encode()
+        )
+
+    for f in fields(settings):
+        if f.name in _CACHE_INDEPENDENT_SETTINGS:
+            continue
+        value = getattr(settings, f.name)
+        # Set iteration order is not stable across processes
+        if isinstance(value, (set, frozenset)):
+            value = sorted(repr(v) for v in value)
+        hasher.update(f"{f.name}={value!r};".encode())
+
+    return hasher.hexdigest()
+
+
+def _encode_weight_name_map(
+    weight_name_map: Optional[dict[Any, Any]]
+) -> Optional[dict[str, Any]]:
+    # Values are [state_dict name(s), numpy dtype], dtypes are stored by name
+    if weight_name_map is None:
+        return None
+    return {k: [v[0], str(v[1])] for k, v in weight_name_map.items()}
+
+
+def _decode_weight_name_map(
+    weight_name_map: Optional[dict[str, Any]]
+) -> Optional[dict[Any, Any]]:
+    if weight_name_map is None:
+        return None
+    return {k: [v[0], np.dtype(v[1])] for k, v in weight_name_map.items()}
+
+
+class DiskEngineCache:
+    """Stores serialized TensorRT engines in a directory on disk
+
+    Each entry is the raw engine next to a JSON file with its metadata. Once the
+    cache exceeds its size budget, the least recently used entries are evicted.
+    The cache is best-effort: failures to read or write it are logged and treated
+    as cache misses
+
+    Args:
+        engine_cache_dir (str): Directory in which engines are stored
+        engine_cache_size (int): Maximum total size of the stored engines, in bytes
+    """
+
+    def __init__(self, engine_cache_dir: str, engine_cache_size: int) -> None:
+        self.engine_cache_dir = engine_cache_dir
+        self.engine_cache_size = engine_cache_size
+
+    def _path(self, hash: str) -> str:
+        return os.path.join(self.engine_cache_dir, f"{hash}.engine")
+
+    def _metadata_path(self, hash: str) -> str:
+        return os.path.join(self.engine_cache_dir, f"{hash}.json")
+
+    def save(self, hash: str, entry: EngineCacheEntry) -> None:
+        (
+            serialized_engine,
+            input_names,
+            output_names,
+            weight_name_map,
+            signature,
+        ) = entry
+        try:
+            metadata = json.dumps(
+                {
+                    "input_names": list(input_names),
+                    "output_names": list(output_names),
+                    "weight_name_map": _encode_weight_name_map(weight_name_map),
+                    "input_signature": signature,
+                }
+            ).encode()
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to encode engine {hash} for the engine cache: {e}")
+            return
+        entry_size = len(serialized_engine) + len(metadata)
+        if entry_size > self.engine_cache_size:
+            logger.warning(
+                f"Engine of size {entry_size} bytes exceeds the engine cache size "
+                f"({self.engine_cache_size} bytes), not caching it"
+            )
+            return
+
+        try:
+            os.makedirs(self.engine_cache_dir, exist_ok=True)
+            self._evict(entry_size)
+
+            # Write to temporary files first so concurrent readers never observe
+            # partial entries. The metadata is written last and marks the entry complete
+            for path, blob in (
+                (self._path(hash), serialized_engine),
+                (self._metadata_path(hash), metadata),
+            ):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save engine {hash} to the engine cache: {e}")
+            return
+        logger.debug(f"Saved engine {hash} to the engine cache")
+
+    def load(self, hash: str) -> Optional[EngineCacheEntry]:
+        path = self._path(hash)
+        metadata_path = self._metadata_path(hash)
+        if not os.path.exists(metadata_path):
+            return None
+
+        try:
+            with open(metadata_path, "rb") as f:
+                metadata = json.loads(f.read())
+            with open(path, "rb") as f:
+                serialized_engine = f.read()
+            entry: EngineCacheEntry = (
+                serialized_engine,
+                list(metadata["input_names"]),
+                list(metadata["output_names"]),
+                _decode_weight_name_map(metadata["weight_name_map"]),
+                tuple(tuple(i) for i in metadata["input_signature"]),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to read engine cache entry {path}, ignoring it: {e}"
+            )
+            return None
+
+        # Refresh the access time used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _evict(self, required_size: int) -> None:
+        entries = []
+        for file_name in os.listdir(self.engine_cache_dir):
+            if not file_name.endswith(".engine"):
+                continue
+            path = os.path.join(self.engine_cache_dir, file_name)
+            metadata_path = f"{path[: -len('.engine')]}.json"
+            try:
+                stat = os.stat(path)
+                size = stat.st_size
+                if os.path.exists(metadata_path):
+                    size += os.stat(metadata_path).st_size
+            except FileNotFoundError:
+                # Evicted concurrently by another process
+                continue
+            entries.append((stat.st_mtime, size, path, metadata_path))
+
+        total_size = sum(size for _, size, _, _ in entries)
+        for _, size, path, metadata_path in sorted(entries):
+            if total_size + required_size <= self.engine_cache_size:
+                break
+            # Remove the metadata first so readers never pair it with a missing engine
+            for p in (metadata_path, path):
+                try:
+                    os.remove(p)
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+            logger.debug(f"Evicted {path} from the engine cache")
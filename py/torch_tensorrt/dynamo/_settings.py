@@ -14,6 +14,8 @@ from torch_tensorrt.dynamo._defaults import (
     DRYRUN,
     ENABLE_EXPERIMENTAL_DECOMPOSITIONS,
     ENABLED_PRECISIONS,
+    ENGINE_CACHE_DIR,
+    ENGINE_CACHE_SIZE,
     ENGINE_CAPABILITY,
     HARDWARE_COMPATIBLE,
     LAZY_ENGINE_INIT,
@@ -29,6 +31,7 @@ from torch_tensorrt.dynamo._defaults import (
     TRUNCATE_DOUBLE,
     USE_FAST_PARTITIONER,
     USE_PYTHON_RUNTIME,
+    VALIDATE_REFIT,
     VERSION_COMPATIBLE,
     WORKSPACE_SIZE,
     default_device,
@@ -64,6 +67,7 @@ class CompilationSettings:
         disable_tf32 (bool): Whether to disable TF32 computation for TRT layers
         sparse_weights (bool): Whether to allow the builder to use sparse weights
         refit (bool): Whether to build a refittable engine
+        validate_refit (bool): Whether to test-refit each refittable engine after it is built, discarding the cached weight name map if fast refit fails
         engine_capability (trt.EngineCapability): Restrict kernel selection to safe gpu kernels or safe dla kernels
         num_avg_timing_iters (int): Number of averaging timing iterations used to select kernels
         dla_sram_size (int): Fast software managed RAM used by DLA to communicate within a layer.
@@ -74,6 +78,8 @@ class CompilationSettings:
             output to a file if a string path is specified
         hardware_compatible (bool): Build the TensorRT engines compatible with GPU architectures other than that of the GPU on which the engine was built (currently works for NVIDIA Ampere and newer)
         timing_cache_path (str): Path to the timing cache if it exists (or) where it will be saved after compilation
+        engine_cache_dir (Optional[str]): Directory in which built engines are cached and reused across compilations. Caching is disabled if None
+        engine_cache_size (int): Maximum total size in bytes of the engines stored in the engine cache
     """
 
     enabled_precisions: Set[dtype] = field(default_factory=lambda: ENABLED_PRECISIONS)
@@ -95,6 +101,7 @@ class CompilationSettings:
     assume_dynamic_shape_support: bool = ASSUME_DYNAMIC_SHAPE_SUPPORT
     sparse_weights: bool = SPARSE_WEIGHTS
     make_refitable: bool = MAKE_REFITABLE
+    validate_refit: bool = VALIDATE_REFIT
     engine_capability: EngineCapability = field(
         default_factory=lambda: ENGINE_CAPABILITY
     )
@@ -106,3 +113,5 @@ class CompilationSettings:
     hardware_compatible: bool = HARDWARE_COMPATIBLE
     timing_cache_path: str = TIMING_CACHE_PATH
     lazy_engine_init: bool = LAZY_ENGINE_INIT
+    engine_cache_dir: Optional[str] = ENGINE_CACHE_DIR
+    engine_cache_size: int = ENGINE_CACHE_SIZE
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, Set, Tuple
 
 from torch_tensorrt.dynamo._settings import CompilationSettings
-from torch_tensorrt.fx.types import TRTNetwork
+from torch_tensorrt.fx.types import TRTNetwork, TRTTensor
 
 
 @dataclass
@@ -11,9 +12,13 @@ class ConversionContext:
     Args:
         net: TensorRT Network being built
         compilation_settings: Settings selected by the user for compilation
+        constant_cache: Constant layers already added for tensors of the module, keyed by their memory
+        module_tensor_ptrs: Device and data pointer of every tensor owned by the module being converted
     """
 
     net: TRTNetwork
     compilation_settings: CompilationSettings = field(
         default_factory=CompilationSettings
     )
+    constant_cache: Dict[Any, TRTTensor] = field(default_factory=dict)
+    module_tensor_ptrs: Set[Tuple[Any, int]] = field(default_factory=set)
@@ -34,6 +34,7 @@ from torch_tensorrt.dynamo.conversion._ConverterRegistry import (
 from torch_tensorrt.dynamo.conversion._ConverterRegistry import CallingConvention
 from torch_tensorrt.dynamo.conversion._TRTBuilderMonitor import TRTBulderMonitor
 from torch_tensorrt.dynamo.conversion.converter_utils import (
+    get_module_tensor_ptrs,
     get_node_io,
     get_node_name,
     get_trt_tensor,
@@ -84,7 +85,9 @@ class TRTInterpreter(torch.fx.Interpreter):  # type: ignore[misc]
         flag |= EXPLICIT_BATCH
 
         self.ctx = ConversionContext(
-            self.builder.create_network(flag), compilation_settings
+            self.builder.create_network(flag),
+            compilation_settings,
+            module_tensor_ptrs=get_module_tensor_ptrs(module),
         )
 
         assert TRTInterpreter._all_precisions_supported(
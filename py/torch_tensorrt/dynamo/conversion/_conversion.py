@@ -1,25 +1,50 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
 from typing import Any, List, Optional, Sequence
 
 import tensorrt as trt
 import torch
+from torch._subclasses.fake_tensor import FakeTensorMode
 from torch.fx.experimental.proxy_tensor import unset_fake_temporarily
 from torch_tensorrt._Device import Device
 from torch_tensorrt._enums import dtype
 from torch_tensorrt._features import ENABLED_FEATURES
 from torch_tensorrt._Input import Input
+from torch_tensorrt.dynamo._engine_cache import (
+    DiskEngineCache,
+    get_hash,
+    input_signature,
+)
 from torch_tensorrt.dynamo._settings import CompilationSettings
 from torch_tensorrt.dynamo.conversion._TRTInterpreter import (
     TRTInterpreter,
     TRTInterpreterResult,
 )
 from torch_tensorrt.dynamo.runtime import PythonTorchTensorRTModule, TorchTensorRTModule
+from torch_tensorrt.dynamo.runtime._TorchGpuAllocator import GPU_ALLOCATOR
 from torch_tensorrt.dynamo.utils import get_torch_inputs
 
 logger = logging.getLogger(__name__)
 
+# Dtypes of Python scalar outputs, matching the dtype torch.tensor(output) would infer
+_SCALAR_DTYPES = {bool: torch.bool, int: torch.int64}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_trt_runtime() -> trt.Runtime:
+    """Returns a TensorRT runtime shared across conversions, created on first use
+
+    The runtime allocates device memory through the PyTorch caching allocator
+    """
+    from torch_tensorrt.logging import TRT_LOGGER
+
+    runtime = trt.Runtime(TRT_LOGGER)
+    runtime.gpu_allocator = GPU_ALLOCATOR
+    return runtime
+
 
 def infer_module_output_dtypes(
     module: torch.fx.GraphModule,
@@ -32,13 +57,32 @@ def infer_module_output_dtypes(
     inputs can be either arg_inputs or flattened input list. If it is flattened list, kwarg_inputs
     should be None, as it is already included in the flattened input.
     """
+    if kwarg_inputs is None:
+        kwarg_inputs = {}
+
     with unset_fake_temporarily():
-        torch_inputs = get_torch_inputs(inputs, device)
-        if kwarg_inputs is None:
-            kwarg_inputs = {}
-        torch_kwarg_inputs = get_torch_inputs(kwarg_inputs, device)
-        module = module.to(device.to(torch.device))
-        module_outputs = module(*torch_inputs, **torch_kwarg_inputs)
+        try:
+            # Propagate dtypes through the graph with fake tensors, which avoids
+            # allocating real inputs and launching any kernels
+            with FakeTensorMode(allow_non_fake_inputs=True):
+                torch_inputs = get_torch_inputs(inputs, device)
+                torch_kwarg_inputs = get_torch_inputs(kwarg_inputs, device)
+                module_outputs = module(*torch_inputs, **torch_kwarg_inputs)
+        except Exception:
+            logger.debug(
+                "Fake tensor propagation failed, running the module to infer output dtypes",
+                exc_info=True,
+            )
+            torch_inputs = get_torch_inputs(inputs, device)
+            torch_kwarg_inputs = get_torch_inputs(kwarg_inputs, device)
+            torch_device = device.to(torch.device)
+            if any(
+                t.device != torch_device
+                for t in itertools.chain(module.parameters(), module.buffers())
+            ):
+                module = module.to(torch_device)
+            module_outputs = module(*torch_inputs, **torch_kwarg_inputs)
+
         if not isinstance(module_outputs, (list, tuple)):
             module_outputs = [module_outputs]
 
@@ -46,20 +90,24 @@ def infer_module_output_dtypes(
     # such as aten.sum - such outputs can be truncated
     output_dtypes = []
     for output in module_outputs:
-        output_ = output
         # We don't need to check if output is nested here because the input module will be flattened
-        if not isinstance(output, torch.Tensor):
-            if isinstance(output, str):
-                raise ValueError(
-                    f"Received an output type {type(output)} that's not in the acceptable datatypes (https://pytorch.org/docs/stable/tensor_attributes.html#torch.dtype)"
-                )
-            else:
-                output_ = torch.tensor(output)
+        if isinstance(output, torch.Tensor):
+            output_dtype = output.dtype
+        elif isinstance(output, str):
+            raise ValueError(
+                f"Received an output type {type(output)} that's not in the acceptable datatypes (https://pytorch.org/docs/stable/tensor_attributes.html#torch.dtype)"
+            )
+        elif type(output) in _SCALAR_DTYPES:
+            output_dtype = _SCALAR_DTYPES[type(output)]
+        elif type(output) is float:
+            output_dtype = torch.get_default_dtype()
+        else:
+            output_dtype = torch.tensor(output).dtype
 
-        if truncate_double and output_.dtype == dtype.float64:
+        if truncate_double and output_dtype == torch.float64:
             output_dtypes.append(dtype.float32)
         else:
-            output_dtypes.append(dtype._from(output_.dtype))
+            output_dtypes.append(dtype._from(output_dtype))
 
     return output_dtypes
 
@@ -125,32 +173,61 @@ def convert_module(
     Returns:
         PythonTorchTensorRTModule or TorchTensorRTModule
     """
-    interpreter_result = interpret_module_to_result(module, inputs, settings)
-    # Test fast refit:
-    from torch_tensorrt.dynamo._refit import _refit_single_trt_engine_with_gm
-    from torch_tensorrt.logging import TRT_LOGGER
+    interpreter_result = None
+    if settings.engine_cache_dir is not None:
+        engine_cache = DiskEngineCache(
+            settings.engine_cache_dir, settings.engine_cache_size
+        )
+        engine_hash = get_hash(module, inputs, settings)
+        cached = engine_cache.load(engine_hash)
+        # Validate the stored shape profile to guard against stale or colliding entries
+        if cached is not None and cached[4] == input_signature(inputs):
+            logger.info(
+                f"Found the cached engine {engine_hash}, skipping TRT conversion"
+            )
+            interpreter_result = TRTInterpreterResult(*cached[:4])
+
+    if interpreter_result is None:
+        interpreter_result = interpret_module_to_result(module, inputs, settings)
+        if settings.engine_cache_dir is not None:
+            engine_cache.save(
+                engine_hash,
+                (
+                    interpreter_result.serialized_engine,
+                    list(interpreter_result.input_names),
+                    list(interpreter_result.output_names),
+                    interpreter_result.weight_name_map,
+                    input_signature(inputs),
+                ),
+            )
 
     weight_name_map: Any = None
-    # Do the test refit with cached map if make_refitable is enabled
     if settings.make_refitable:
-        runtime = trt.Runtime(TRT_LOGGER)
-        refit_test_engine = runtime.deserialize_cuda_engine(
-            interpreter_result.serialized_engine
-        )
-        try:
-            _refit_single_trt_engine_with_gm(
-                new_gm=module,
-                old_engine=refit_test_engine,
-                input_list=inputs,
-                settings=settings,
-                weight_name_map=interpreter_result.weight_name_map,
+        weight_name_map = interpreter_result.weight_name_map
+
+        # Optionally check the cached weight map with a test refit. Refitting falls
+        # back to the slow path on failure anyway, so this is a self-test only
+        if settings.validate_refit:
+            from torch_tensorrt.dynamo._refit import _refit_single_trt_engine_with_gm
+
+            refit_test_engine = _get_trt_runtime().deserialize_cuda_engine(
+                interpreter_result.serialized_engine
             )
-            weight_name_map = interpreter_result.weight_name_map
-        except AssertionError:
-            logger.warning("Fast refit test failed. Removing the weight map caching.")
+            try:
+                _refit_single_trt_engine_with_gm(
+                    new_gm=module,
+                    old_engine=refit_test_engine,
+                    input_list=inputs,
+                    settings=settings,
+                    weight_name_map=weight_name_map,
+                )
+            except AssertionError:
+                logger.warning(
+                    "Fast refit test failed. Removing the weight map caching."
+                )
+                weight_name_map = None
 
-        del refit_test_engine
-        torch.cuda.empty_cache()
+            del refit_test_engine
 
     rt_cls = PythonTorchTensorRTModule
 
@@ -1,7 +1,19 @@
 import collections
 import functools
+import itertools
 import logging
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    overload,
+)
 
 import numpy as np
 import torch
@@ -337,6 +349,12 @@ def create_constant(
     Returns:
         A TensorRT ITensor that represents the given value.
     """
+    # Tensors of the module used several times (e.g. tied weights) are only added
+    # to the network once
+    cache_key = _constant_cache_key(ctx, value, dtype)
+    if cache_key is not None and cache_key in ctx.constant_cache:
+        return ctx.constant_cache[cache_key]
+
     shape = (1,)
     # Rank 0 constant is required in IFillLayer inputs.
     if min_rank == 0:
@@ -347,9 +365,53 @@ def create_constant(
         numpy_value.copy() if isinstance(numpy_value, np.ndarray) else numpy_value,
     )
     constant.name = name
+
+    if cache_key is not None:
+        ctx.constant_cache[cache_key] = constant.get_output(0)
     return constant.get_output(0)
 
 
+def get_module_tensor_ptrs(module: torch.nn.Module) -> Set[Tuple[torch.device, int]]:
+    """
+    Collect the device and data pointer of every tensor owned by `module`.
+    Args:
+        module (torch.nn.Module): The module being converted.
+    Returns:
+        The (device, data pointer) of its parameters, buffers and tensor attributes.
+    """
+    ptrs = set()
+    for submodule in module.modules():
+        for tensor in itertools.chain(
+            submodule.parameters(recurse=False),
+            submodule.buffers(recurse=False),
+            vars(submodule).values(),
+        ):
+            if isinstance(tensor, torch.Tensor):
+                ptrs.add((tensor.device, tensor.data_ptr()))
+    return ptrs
+
+
+def _constant_cache_key(
+    ctx: ConversionContext,
+    value: Any,
+    dtype: Optional[Union[torch.dtype, np.dtype, TRTDataType, _enums.dtype]],
+) -> Optional[Tuple[Any, ...]]:
+    if isinstance(value, torch.Tensor):
+        device, ptr, strides = value.device, value.data_ptr(), value.stride()
+    elif isinstance(value, np.ndarray):
+        device = torch.device("cpu")
+        ptr, strides = value.__array_interface__["data"][0], value.strides
+    else:
+        return None
+
+    # Only memory owned by the module is kept alive for the whole conversion, so
+    # only its address cannot be taken over by another value. Temporaries are not
+    # cached, which also avoids holding on to them until the network is built
+    if (device, ptr) not in ctx.module_tensor_ptrs:
+        return None
+    return (type(value), device, ptr, tuple(value.shape), strides, value.dtype, dtype)
+
+
 def get_trt_tensor(
     ctx: ConversionContext,
     input_val: Any,
@@ -27,6 +27,11 @@ def matrix_multiply(
     if not isinstance(input, trt.ITensor):
         input = get_trt_tensor(ctx, input, f"{name}_input")
     if not isinstance(other, trt.ITensor):
+        # Prepend the broadcast dimensions of constant matrices on the host
+        # instead of adding a shuffle layer to the network
+        rank_diff = len(input.shape) - len(other.shape)
+        if len(other.shape) > 1 and rank_diff > 0:
+            other = other.reshape((1,) * rank_diff + tuple(other.shape))
         other = get_trt_tensor(
             ctx,
             other,
@@ -11,6 +11,7 @@ from torch.nn import Module
 from torch_tensorrt._Device import Device
 from torch_tensorrt._enums import Platform, dtype
 from torch_tensorrt.dynamo._settings import CompilationSettings
+from torch_tensorrt.dynamo.runtime._TorchGpuAllocator import GPU_ALLOCATOR
 from torch_tensorrt.dynamo.utils import DYNAMIC_DIM
 from torch_tensorrt.logging import TRT_LOGGER
 from torch_tensorrt.runtime._utils import (
@@ -118,6 +119,9 @@ class PythonTorchTensorRTModule(Module):  # type: ignore[misc]
 
         self.initialized = True
         runtime = trt.Runtime(TRT_LOGGER)
+        # Device memory of the engine and its execution context comes from the
+        # PyTorch caching allocator, so it is shared with the rest of the program
+        runtime.gpu_allocator = GPU_ALLOCATOR
         self.engine = runtime.deserialize_cuda_engine(self.serialized_engine)
         self.context = self.engine.create_execution_context()
 
@@ -0,0 +1,59 @@
+import logging
+from typing import Dict, Optional
+
+import torch
+
+import tensorrt as trt
+
+logger = logging.getLogger(__name__)
+
+# Alignment the caching allocator's blocks are known to have; cudaMalloc only
+# guarantees 256 bytes for segment bases, so stricter requests are padded
+_CACHING_ALLOCATOR_ALIGNMENT = 256
+
+
+class TorchGpuAllocator(trt.IGpuAllocator):  # type: ignore[misc]
+    """Serves TensorRT device allocations from the PyTorch caching allocator
+
+    Memory released by TensorRT returns to the pool PyTorch allocates from,
+    instead of being held in a separate TensorRT-owned pool
+    """
+
+    def __init__(self) -> None:
+        trt.IGpuAllocator.__init__(self)
+        # Aligned pointers handed to TensorRT -> blocks returned by the caching allocator
+        self._unaligned: Dict[int, int] = {}
+
+    def allocate(self, size: int, alignment: int, flags: int) -> int:
+        return self.allocate_async(size, alignment, flags, None)
+
+    def allocate_async(
+        self, size: int, alignment: int, flags: int, stream: Optional[int]
+    ) -> int:
+        if size == 0:
+            return 0
+        if alignment <= 0 or _CACHING_ALLOCATOR_ALIGNMENT % alignment == 0:
+            ptr: int = torch.cuda.caching_allocator_alloc(size, stream=stream)
+            return ptr
+
+        # Stricter alignment than the caching allocator guarantees, over-allocate
+        # so that an aligned block of the requested size fits
+        logger.debug(
+            f"TensorRT requested {alignment} byte alignment, padding the allocation"
+        )
+        ptr = torch.cuda.caching_allocator_alloc(size + alignment - 1, stream=stream)
+        aligned_ptr = (ptr + alignment - 1) // alignment * alignment
+        self._unaligned[aligned_ptr] = ptr
+        return aligned_ptr
+
+    def deallocate(self, memory: int) -> bool:
+        return self.deallocate_async(memory, None)
+
+    def deallocate_async(self, memory: int, stream: Optional[int]) -> bool:
+        if memory:
+            torch.cuda.caching_allocator_delete(self._unaligned.pop(memory, memory))
+        return True
+
+
+# TensorRT does not own the allocator, so it must outlive every runtime using it
+GPU_ALLOCATOR = TorchGpuAllocator()
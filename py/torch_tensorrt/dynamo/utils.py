@@ -1,23 +1,21 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import fields, replace
-from enum import Enum
+from dataclasses import fields
 from typing import Any, Callable, Dict, Optional, Sequence, Union
 
-import numpy as np
-import tensorrt as trt
 import torch
+import torch.utils._pytree as pytree
 from torch_tensorrt._Device import Device
 from torch_tensorrt._enums import dtype
 from torch_tensorrt._Input import Input
+from torch_tensorrt._utils import sanitized_torch_version
 from torch_tensorrt.dynamo import _defaults
 from torch_tensorrt.dynamo._settings import CompilationSettings
 
 from packaging import version
 
-from .types import TRTDataType
-
 logger = logging.getLogger(__name__)
 
 COSINE_THRESHOLD = 0.99
@@ -25,56 +23,11 @@ DYNAMIC_DIM = -1
 RTOL = 5e-3
 ATOL = 5e-3
 
-
-class Frameworks(Enum):
-    NUMPY = "numpy"
-    TORCH = "torch"
-    TRT = "trt"
-
-
-DataTypeEquivalence: Dict[
-    TRTDataType, Dict[Frameworks, Union[TRTDataType, np.dtype, torch.dtype]]
-] = {
-    trt.int8: {
-        Frameworks.NUMPY: np.int8,
-        Frameworks.TORCH: torch.int8,
-        Frameworks.TRT: trt.int8,
-    },
-    trt.int32: {
-        Frameworks.NUMPY: np.int32,
-        Frameworks.TORCH: torch.int32,
-        Frameworks.TRT: trt.int32,
-    },
-    trt.int64: {
-        Frameworks.NUMPY: np.int64,
-        Frameworks.TORCH: torch.int64,
-        Frameworks.TRT: trt.int64,
-    },
-    trt.float16: {
-        Frameworks.NUMPY: np.float16,
-        Frameworks.TORCH: torch.float16,
-        Frameworks.TRT: trt.float16,
-    },
-    trt.float32: {
-        Frameworks.NUMPY: np.float32,
-        Frameworks.TORCH: torch.float32,
-        Frameworks.TRT: trt.float32,
-    },
-    trt.bool: {
-        Frameworks.NUMPY: bool,
-        Frameworks.TORCH: torch.bool,
-        Frameworks.TRT: trt.bool,
-    },
-}
-
-if trt.__version__ >= "7.0":
-    DataTypeEquivalence[trt.bool] = {
-        Frameworks.NUMPY: np.bool_,
-        Frameworks.TORCH: torch.bool,
-        Frameworks.TRT: trt.bool,
-    }
+_TORCH_VERSION = version.parse(sanitized_torch_version())
+_SETTINGS_FIELDS = frozenset(attr.name for attr in fields(CompilationSettings))
 
 
+@functools.lru_cache(maxsize=None)
 def use_python_runtime_parser(use_python_runtime: Optional[bool] = None) -> bool:
     """Parses a user-provided input argument regarding Python runtime
 
@@ -109,15 +62,19 @@ def use_python_runtime_parser(use_python_runtime: Optional[bool] = None) -> bool
 def cosine_similarity(gt_tensor: torch.Tensor, pred_tensor: torch.Tensor) -> float:
     gt_tensor = gt_tensor.flatten().to(torch.float32)
     pred_tensor = pred_tensor.flatten().to(torch.float32)
-    if torch.sum(gt_tensor) == 0.0 or torch.sum(pred_tensor) == 0.0:
-        if torch.allclose(gt_tensor, pred_tensor, atol=1e-4, rtol=1e-4, equal_nan=True):
-            return 1.0
     res_t = torch.nn.functional.cosine_similarity(
         gt_tensor, pred_tensor, dim=0, eps=1e-6
     )
-    res: float = res_t.cpu().detach().item()
+    has_zero_sum = (torch.sum(gt_tensor) == 0.0) | (torch.sum(pred_tensor) == 0.0)
+
+    # Fetch the similarity and the zero-sum check with a single device sync
+    res, zero_sum = torch.stack([res_t, has_zero_sum.to(torch.float32)]).tolist()
+    if zero_sum and torch.allclose(
+        gt_tensor, pred_tensor, atol=1e-4, rtol=1e-4, equal_nan=True
+    ):
+        return 1.0
 
-    return res
+    return float(res)
 
 
 def input_is_dynamic(inputs: Sequence[Union[Input, torch.Tensor]]) -> bool:
@@ -140,35 +97,25 @@ def get_torch_inputs(
     on the mode requested.
     """
     device = to_torch_device(device)
-    if mode:
-        if isinstance(inputs, dict):
-            result = {}
-            for k, v in inputs.items():
-                if isinstance(v, (list, tuple, dict)):
-                    result[k] = get_torch_inputs(v, device)
-                else:
-                    result[k] = v.example_tensor(mode).to(device)
-            return result
+    # Host-to-device copies are queued without blocking the host; consumers on the
+    # current stream are ordered after them. Copies to the host must stay blocking
+    non_blocking = device.type == "cuda"
+
+    def to_torch_tensor(input: Any) -> Any:
+        if not isinstance(input, Input):
+            return input
+        if mode:
+            tensor = input.example_tensor(mode)
         else:
-            return [
-                input.example_tensor(mode).to(device)
-                for input in inputs
-                if isinstance(input, Input)
-            ]
+            tensor = input.torch_tensor
+        return tensor.to(device, non_blocking=non_blocking)
 
     if isinstance(inputs, dict):
-        result = {}
-        for k, v in inputs.items():
-            if isinstance(v, (list, tuple, dict)):
-                result[k] = get_torch_inputs(v, device)
-            else:
-                result[k] = v.torch_tensor.to(device)
-        return result
+        return pytree.tree_map(to_torch_tensor, inputs)
+    elif mode:
+        return [to_torch_tensor(input) for input in inputs if isinstance(input, Input)]
     else:
-        return [
-            input.torch_tensor.to(device) if isinstance(input, Input) else input
-            for input in inputs
-        ]
+        return [to_torch_tensor(input) for input in inputs]
 
 
 def set_log_level(parent_logger: Any, level: Any) -> None:
@@ -185,44 +132,23 @@ def prepare_inputs(
     inputs: Input | torch.Tensor | Sequence[Any] | Dict[Any, Any],
     disable_memory_format_check: bool = False,
 ) -> Any:
-    if isinstance(inputs, Input):
-        return inputs
-
-    elif isinstance(inputs, torch.Tensor):
-        return Input.from_tensor(
-            inputs, disable_memory_format_check=disable_memory_format_check
-        )
+    def prepare_input(input_obj: Any) -> Input:
+        if isinstance(input_obj, Input):
+            return input_obj
 
-    elif isinstance(inputs, (list, tuple)):
-        torchtrt_input_list = []
-        for input_obj in inputs:
-            torchtrt_input = prepare_inputs(
+        elif isinstance(input_obj, torch.Tensor):
+            return Input.from_tensor(
                 input_obj, disable_memory_format_check=disable_memory_format_check
             )
-            torchtrt_input_list.append(torchtrt_input)
 
-        return (
-            torchtrt_input_list
-            if isinstance(inputs, list)
-            else tuple(torchtrt_input_list)
-        )
-
-    elif isinstance(inputs, dict):
-        torchtrt_inputs_dict: Dict[Any, Any] = dict()
-
-        for key, input_obj in inputs.items():
-            torchtrt_input = prepare_inputs(
-                input_obj, disable_memory_format_check=disable_memory_format_check
+        else:
+            raise ValueError(
+                f"Invalid input type {type(input_obj)} encountered in the dynamo_compile input parsing. "
+                + "Allowed input types: {torch_tensorrt.Input, torch.Tensor, list, tuple, dict}"
             )
-            torchtrt_inputs_dict[key] = torchtrt_input
-
-        return torchtrt_inputs_dict
 
-    else:
-        raise ValueError(
-            f"Invalid input type {type(inputs)} encountered in the dynamo_compile input parsing. "
-            + "Allowed input types: {torch_tensorrt.Input, torch.Tensor, list, tuple, dict}"
-        )
+    # None is a pytree node by default, treat it as an (invalid) leaf instead
+    return pytree.tree_map(prepare_input, inputs, is_leaf=lambda x: x is None)
 
 
 def parse_complex_tensor_structs(
@@ -234,43 +160,24 @@ def parse_complex_tensor_structs(
     Extracts key attributes of each singular element, while reconstructing the struct
     Optionally applies a function to each attribute before returning
     """
-    if isinstance(inputs, (torch.Tensor, Input)):
-        return apply_fn(getattr(inputs, attribute_to_extract, None))
-    elif isinstance(inputs, (int, float, bool)):
-        # inputs is a python scalar value
-        inputs_torch = torch.tensor(inputs)
-        return apply_fn(getattr(inputs_torch, attribute_to_extract, None))
-
-    elif isinstance(inputs, (list, tuple)):
-        torchtrt_input_list = []
-        for input_obj in inputs:
-            torchtrt_input = parse_complex_tensor_structs(
-                input_obj, attribute_to_extract, apply_fn
-            )
-            torchtrt_input_list.append(torchtrt_input)
 
-        return (
-            torchtrt_input_list
-            if isinstance(inputs, list)
-            else tuple(torchtrt_input_list)
-        )
+    def parse_leaf(input_obj: Any) -> Any:
+        if isinstance(input_obj, (torch.Tensor, Input)):
+            return apply_fn(getattr(input_obj, attribute_to_extract, None))
 
-    elif isinstance(inputs, dict):
-        torchtrt_inputs_dict: Dict[Any, Any] = dict()
+        elif isinstance(input_obj, (int, float, bool)):
+            # input_obj is a python scalar value
+            inputs_torch = torch.tensor(input_obj)
+            return apply_fn(getattr(inputs_torch, attribute_to_extract, None))
 
-        for key, input_obj in inputs.items():
-            torchtrt_input = parse_complex_tensor_structs(
-                input_obj, attribute_to_extract, apply_fn
+        else:
+            raise ValueError(
+                f"Invalid input type {type(input_obj)} encountered during Dynamo input parsing. "
+                + "Allowed input types: {torch_tensorrt.Input, torch.Tensor, list, tuple, dict}"
             )
-            torchtrt_inputs_dict[key] = torchtrt_input
 
-        return torchtrt_inputs_dict
-
-    else:
-        raise ValueError(
-            f"Invalid input type {type(inputs)} encountered during Dynamo input parsing. "
-            + "Allowed input types: {torch_tensorrt.Input, torch.Tensor, list, tuple, dict}"
-        )
+    # None is a pytree node by default, treat it as an (invalid) leaf instead
+    return pytree.tree_map(parse_leaf, inputs, is_leaf=lambda x: x is None)
 
 
 def to_torch_device(device: Optional[Union[Device, torch.device, str]]) -> torch.device:
@@ -321,9 +228,9 @@ def parse_dynamo_kwargs(kwargs: Any) -> CompilationSettings:
         if "options" in kwargs and len(kwargs) == 1:
             kwargs = kwargs["options"]
 
-        valid_attrs = {attr.name for attr in fields(settings)}
-        valid_kwargs = {k: v for k, v in kwargs.items() if k in valid_attrs}
-        settings = replace(settings, **valid_kwargs)
+        for k, v in kwargs.items():
+            if k in _SETTINGS_FIELDS:
+                setattr(settings, k, v)
 
     # TODO: Remove once Dynamo precisions refactoring is complete
     if "enabled_precisions" in kwargs:
@@ -377,19 +284,18 @@ def req_torch_version(min_torch_version: str = "2.dev") -> Callable[..., Any]:
         an unsupported Torch version is used
     """
 
+    is_supported = _TORCH_VERSION >= version.parse(min_torch_version)
+
     def nested_decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        # The installed version is fixed, so supported functions need no wrapper
+        if is_supported:
+            return f
+
         def function_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Parse minimum and current Torch versions
-            min_version = version.parse(min_torch_version)
-            current_version = version.parse(torch.__version__)
-
-            if current_version < min_version:
-                raise AssertionError(
-                    f"Expected Torch version {min_torch_version} or greater, "
-                    + f"when calling {f}. Detected version {torch.__version__}"
-                )
-            else:
-                return f(*args, **kwargs)
+            raise AssertionError(
+                f"Expected Torch version {min_torch_version} or greater, "
+                + f"when calling {f}. Detected version {torch.__version__}"
+            )
 
         return function_wrapper
 
@@ -424,31 +330,40 @@ def check_output_equal(
         )
         return False
 
-    if isinstance(output1, torch.Tensor):
-        if output1.shape != output2.shape:
-            return False
-        return torch.allclose(output1, output2, rtol, atol)  # type: ignore
+    # None is a pytree node by default, treat it as an (unsupported) leaf instead
+    flat_output1, spec1 = pytree.tree_flatten(output1, is_leaf=lambda x: x is None)
+    flat_output2, spec2 = pytree.tree_flatten(output2, is_leaf=lambda x: x is None)
+    if spec1 != spec2:
+        return False
 
-    elif isinstance(output1, (tuple, list)):
-        if len(output1) != len(output2):
+    for a, b in zip(flat_output1, flat_output2):
+        if not isinstance(a, torch.Tensor) or not isinstance(b, torch.Tensor):
+            logger.warning(
+                "The output type is not supported to be checked. Check_output_equal will always return false."
+            )
             return False
-        for a, b in zip(output1, output2):
-            if not check_output_equal(a, b):
-                return False
-            return True
-
-    elif isinstance(output1, dict):
-        if output1.keys() != output2.keys():
+        if not _check_tensor_equal(a, b, rtol, atol):
             return False
-        for a, b in zip(output1.values(), output2.values()):
-            if not check_output_equal(a, b):
-                return False
-        return True
 
-    logger.warning(
-        "The output type is not supported to be checked. Check_output_equal will always return false."
-    )
-    return False
+    return True
+
+
+def _check_tensor_equal(
+    tensor1: torch.Tensor, tensor2: torch.Tensor, rtol: float, atol: float
+) -> bool:
+    if tensor1.shape != tensor2.shape:
+        return False
+    # Views of the same memory hold the same values
+    if tensor1 is tensor2 or (
+        tensor1.data_ptr() == tensor2.data_ptr()
+        and tensor1.stride() == tensor2.stride()
+        and tensor1.dtype == tensor2.dtype
+        and tensor1.device == tensor2.device
+    ):
+        return True
+    if rtol == 0 and atol == 0:
+        return torch.equal(tensor1, tensor2)
+    return torch.allclose(tensor1, tensor2, rtol, atol)  # type: ignore
 
 
 def get_flat_args_with_check(
@@ -468,7 +383,6 @@ def get_flat_args_with_check(
         received_spec is the pytree spec produced while flattening the
         tuple (args, kwargs)
     """
-    import torch.utils._pytree as pytree
     from torch.export._tree_utils import reorder_kwargs
 
     in_spec = exported_program.call_spec.in_spec
@@ -5,7 +5,6 @@ import torch
 import torch.nn as nn
 
 import torch_tensorrt.fx.tracer.acc_tracer.acc_ops as acc_ops
-from parameterized import parameterized
 from torch.testing._internal.common_utils import run_tests
 from torch_tensorrt.fx.tools.common_fx2trt import AccTestCase
 
@@ -13,45 +12,45 @@ from torch_tensorrt.fx.tools.common_fx2trt import AccTestCase
 
 
 class TestPadConverter(AccTestCase):
-    @parameterized.expand(
-        [
+    def test_pad_value(self):
+        inputs = [torch.randn(1, 2, 3, 4)]
+        for name, pad, value in [
             ("1d", (1, 2), 9),
             ("2d", (2, 0, 0, 1), 10),
-        ]
-    )
-    def test_pad_value(self, _, pad, value):
-        class Pad(nn.Module):
-            def forward(self, x):
-                return torch.nn.functional.pad(x, pad, value=value)
-
+        ]:
+            with self.subTest(name=name):
+
+                class Pad(nn.Module):
+                    def forward(self, x):
+                        return torch.nn.functional.pad(x, pad, value=value)
+
+                self.run_test(
+                    Pad(),
+                    inputs,
+                    expected_ops={acc_ops.pad},
+                    # enable value will not work with implicit batch
+                    test_implicit_batch_dim=False,
+                )
+
+    def test_pad(self):
         inputs = [torch.randn(1, 2, 3, 4)]
-        self.run_test(
-            Pad(),
-            inputs,
-            expected_ops={acc_ops.pad},
-            # enable value will not work with implicit batch
-            test_implicit_batch_dim=False,
-        )
-
-    @parameterized.expand(
-        [
+        for name, pad in [
             ("1d", (1, 2)),
             ("2d", (2, 0, 0, 1)),
-        ]
-    )
-    def test_pad(self, _, pad):
-        class Pad(nn.Module):
-            def forward(self, x):
-                return torch.nn.functional.pad(x, pad)
+        ]:
+            with self.subTest(name=name):
 
-        inputs = [torch.randn(1, 2, 3, 4)]
-        self.run_test(
-            Pad(),
-            inputs,
-            expected_ops={acc_ops.pad},
-            # enable value will not work with implicit batch
-            test_implicit_batch_dim=False,
-        )
+                class Pad(nn.Module):
+                    def forward(self, x):
+                        return torch.nn.functional.pad(x, pad)
+
+                self.run_test(
+                    Pad(),
+                    inputs,
+                    expected_ops={acc_ops.pad},
+                    # enable value will not work with implicit batch
+                    test_implicit_batch_dim=False,
+                )
 
     # Testing with (-1, 3, 3, 3) results into following error:
     # test_pad_with_dynamic_shape_four_dimensions_0_2d (deeplearning.trt.torch_tensorrt.py.torch_tensorrt.fx.test.converters.acc_op.test_pad.TestPadConverter) ... [07/15/2022-09:23:18] [TRT] [E] 2: [intInterval.cpp::max::26] Error Code 2: Internal Error (Assertion !empty() failed. )
@@ -74,19 +73,14 @@ class TestPadConverter(AccTestCase):
         self.run_test_with_dynamic_shape(Pad(), input_specs, expected_ops={acc_ops.pad})
     """
 
-    @parameterized.expand(
-        [
-            ("3d", (2, 2, 3, 1, 2, 2)),
-        ]
-    )
     @unittest.skipIf(
         trt.__version__ < "8.2",
         "Padding 3d only supported in TensorRT 8.2 and later",
     )
-    def test_pad_3d(self, _, pad):
+    def test_pad_3d(self):
         class Pad(nn.Module):
             def forward(self, x):
-                return torch.nn.functional.pad(x, pad)
+                return torch.nn.functional.pad(x, (2, 2, 3, 1, 2, 2))
 
         inputs = [torch.randn(1, 2, 3, 4)]
         self.run_test(
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -54,18 +54,19 @@ DataTypeEquivalence: Dict[
         Frameworks.TRT: trt.float32,
     },
     trt.bool: {
-        Frameworks.NUMPY: bool,
+        Frameworks.NUMPY: np.bool_,
         Frameworks.TORCH: torch.bool,
         Frameworks.TRT: trt.bool,
     },
 }
 
-if trt.__version__ >= "7.0":
-    DataTypeEquivalence[trt.bool] = {
-        Frameworks.NUMPY: np.bool_,
-        Frameworks.TORCH: torch.bool,
-        Frameworks.TRT: trt.bool,
-    }
+# Inverse of DataTypeEquivalence, maps a dtype of any framework to its TensorRT key
+_DTYPE_TO_TRT: Dict[Any, TRTDataType] = {
+    framework_dtype: trt_dtype
+    for trt_dtype, equivalents in DataTypeEquivalence.items()
+    for framework_dtype in equivalents.values()
+}
+_DTYPE_TO_TRT[bool] = trt.bool
 
 
 class LowerPrecision(Enum):
@@ -94,6 +95,8 @@ def unified_dtype_converter(
     """
     Convert TensorRT, Numpy, or Torch data types to any other of those data types.
 
+    Numpy dtype instances (e.g. ``np.dtype("float32")``) and Python ``bool`` are accepted as well.
+
     Args:
         dtype (TRTDataType, torch.dtype, np.dtype): A TensorRT, Numpy, or Torch data type.
         to (Frameworks): The framework to convert the data type to.
@@ -102,21 +105,12 @@ def unified_dtype_converter(
         The equivalent data type in the requested framework.
     """
     assert to in Frameworks, f"Expected valid Framework for translation, got {to}"
-    trt_major_version = int(trt.__version__.split(".")[0])
-    if dtype in (np.int8, torch.int8, trt.int8):
-        return DataTypeEquivalence[trt.int8][to]
-    elif trt_major_version >= 7 and dtype in (np.bool_, torch.bool, trt.bool):
-        return DataTypeEquivalence[trt.bool][to]
-    elif dtype in (np.int32, torch.int32, trt.int32):
-        return DataTypeEquivalence[trt.int32][to]
-    elif dtype in (np.int64, torch.int64, trt.int64):
-        return DataTypeEquivalence[trt.int64][to]
-    elif dtype in (np.float16, torch.float16, trt.float16):
-        return DataTypeEquivalence[trt.float16][to]
-    elif dtype in (np.float32, torch.float32, trt.float32):
-        return DataTypeEquivalence[trt.float32][to]
-    else:
+    # np.dtype instances compare equal to, but do not hash like, their scalar types
+    if isinstance(dtype, np.dtype):
+        dtype = dtype.type
+    if dtype not in _DTYPE_TO_TRT:
         raise TypeError("%s is not a supported dtype" % dtype)
+    return DataTypeEquivalence[_DTYPE_TO_TRT[dtype]][to]
 
 
 def get_dynamic_dims(shape: Shape) -> List[int]:
@@ -1,21 +1,28 @@
 # type: ignore
 
+import functools
 import logging
+import operator
 import time
 import unittest
-from typing import Callable, List, Optional, Tuple
+import weakref
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, List, Optional, Tuple
 
 import torch
 import torch_tensorrt
 from torch.fx.passes.shape_prop import ShapeProp
+from torch.profiler import record_function
 from torch.testing._internal.common_utils import TestCase
 from torch_tensorrt import Input
 from torch_tensorrt._enums import dtype
 from torch_tensorrt.dynamo import _defaults
+from torch_tensorrt.dynamo._engine_cache import get_hash
 from torch_tensorrt.dynamo._settings import CompilationSettings
 
 # Use interpreter, input spec, and test case from fx_ts_compat to test Dynamo Converter Registry
-from torch_tensorrt.dynamo.conversion import TRTInterpreter
+from torch_tensorrt.dynamo.conversion import TRTInterpreter, TRTInterpreterResult
 from torch_tensorrt.dynamo.conversion._conversion import infer_module_output_dtypes
 from torch_tensorrt.dynamo.lowering import (
     get_decompositions,
@@ -27,6 +34,16 @@ from torch_tensorrt.dynamo.utils import ATOL, RTOL, get_torch_inputs
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Engines built by run_test_with_dynamic_shape, keyed by graph, submodules, weights,
+# input specs and settings
+_DYNAMIC_SHAPE_ENGINES: "OrderedDict[Tuple[Any, ...], TRTInterpreterResult]" = (
+    OrderedDict()
+)
+_DYNAMIC_SHAPE_ENGINES_SIZE = 64
+
+# Ops called in a graph, see _ops_in_mod
+_OPS_IN_GRAPH: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 def fetch_attr(mod, target):
     """
@@ -38,15 +55,166 @@ def fetch_attr(mod, target):
     Return:
         Any: The value of the attribute.
     """
-    target_atoms = target.split(".")
-    attr_itr = mod
-    for i, atom in enumerate(target_atoms):
-        if not hasattr(attr_itr, atom):
-            raise RuntimeError(
-                f"Node referenced nonexistent target {'.'.join(target_atoms[:i])}"
-            )
-        attr_itr = getattr(attr_itr, atom)
-    return attr_itr
+    try:
+        return operator.attrgetter(target)(mod)
+    except AttributeError as e:
+        raise RuntimeError(f"Node referenced nonexistent target {target}") from e
+
+
+def _to_device(tensors):
+    """
+    Copy a list of host tensors to the current CUDA device.
+
+    The copies are issued from pinned memory on a side stream, and the current
+    stream waits on them before any work it queues afterwards.
+
+    Args:
+        tensors (List[torch.Tensor]): The tensors to copy
+
+    Return:
+        List[torch.Tensor]: The tensors on the current CUDA device.
+    """
+    compute_stream = torch.cuda.current_stream()
+    copy_stream = torch.cuda.Stream()
+    copy_stream.wait_stream(compute_stream)
+    cuda_tensors = []
+    with torch.cuda.stream(copy_stream):
+        for t in tensors:
+            if not t.is_cuda:
+                if not t.is_pinned():
+                    t = t.pin_memory()
+                t = t.to("cuda", non_blocking=True)
+                # Allocated on the copy stream but consumed on the compute stream
+                t.record_stream(compute_stream)
+            cuda_tensors.append(t)
+    copy_done = torch.cuda.Event()
+    copy_done.record(copy_stream)
+    compute_stream.wait_event(copy_done)
+    return cuda_tensors
+
+
+def _to_host(tensors):
+    """
+    Copy a list of tensors to the host with a single synchronization.
+
+    CUDA tensors are copied asynchronously into pinned host buffers on a side
+    stream, all other values are returned unchanged.
+
+    Args:
+        tensors (List[Any]): The values to copy
+
+    Return:
+        List[Any]: The values, with every tensor on the host.
+    """
+    if not any(isinstance(t, torch.Tensor) and t.is_cuda for t in tensors):
+        return list(tensors)
+
+    copy_stream = torch.cuda.Stream()
+    copy_stream.wait_stream(torch.cuda.current_stream())
+    host_tensors = []
+    with torch.cuda.stream(copy_stream):
+        for t in tensors:
+            if isinstance(t, torch.Tensor) and t.is_cuda:
+                host_t = torch.empty(t.shape, dtype=t.dtype, pin_memory=True)
+                host_t.copy_(t, non_blocking=True)
+                t = host_t
+            host_tensors.append(t)
+    copy_done = torch.cuda.Event()
+    copy_done.record(copy_stream)
+    copy_done.synchronize()
+    return host_tensors
+
+
+def _ops_in_mod(mod):
+    """
+    Collect the ops called in the graph of ``mod``.
+
+    The result is memoized per graph object, so repeated op assertions on the
+    same graph skip the walk over its nodes.
+
+    Args:
+        mod (torch.fx.GraphModule): The module whose graph is inspected
+
+    Return:
+        FrozenSet[Any]: Types of called submodules and targets of called functions/methods.
+    """
+    ops = _OPS_IN_GRAPH.get(mod.graph)
+    if ops is not None:
+        return ops
+
+    ops = set()
+    # Resolve submodules with one lookup each instead of an attribute walk per node
+    modules = dict(mod.named_modules(remove_duplicate=False))
+    for node in mod.graph.nodes:
+        if node.op == "call_module":
+            submod = modules.get(node.target)
+            if submod is None:
+                submod = fetch_attr(mod, node.target)
+            ops.add(type(submod))
+        elif node.op in {"call_function", "call_method"}:
+            ops.add(node.target)
+
+    ops = frozenset(ops)
+    _OPS_IN_GRAPH[mod.graph] = ops
+    return ops
+
+
+@functools.lru_cache(maxsize=16)
+def _compilation_settings(precision=None, debug=False):
+    """
+    Build the settings converter tests compile with.
+
+    Settings are shared between tests, which only read them.
+
+    Args:
+        precision (Optional[torch.dtype]): The precision to enable, None keeps the defaults
+        debug (bool): Whether to enable debug logging
+
+    Return:
+        CompilationSettings: The settings.
+    """
+    # Previous instance of the interpreter auto-casted 64-bit inputs
+    # We replicate this behavior here
+    if precision is None:
+        return CompilationSettings(truncate_double=True, debug=debug)
+    return CompilationSettings(
+        enabled_precisions={dtype._from(precision)},
+        truncate_double=True,
+        debug=debug,
+    )
+
+
+def _is_homogeneous(tensors):
+    return all(
+        t.shape == tensors[0].shape and t.dtype == tensors[0].dtype for t in tensors
+    )
+
+
+class _CachedInterpreter:
+    """
+    Reuses a previously built engine for identical graphs, creating the
+    ``TRTInterpreter`` only on a miss.
+
+    Args:
+        build_interpreter (Callable[[], TRTInterpreter]): Creates the interpreter
+        key (Tuple[Any, ...]): The cache key of the engine
+    """
+
+    def __init__(self, build_interpreter, key):
+        self.build_interpreter = build_interpreter
+        self.key = key
+
+    def run(self):
+        result = _DYNAMIC_SHAPE_ENGINES.get(self.key)
+        if result is not None:
+            _DYNAMIC_SHAPE_ENGINES.move_to_end(self.key)
+            return result
+
+        result = self.build_interpreter().run()
+        _DYNAMIC_SHAPE_ENGINES[self.key] = result
+        if len(_DYNAMIC_SHAPE_ENGINES) > _DYNAMIC_SHAPE_ENGINES_SIZE:
+            _DYNAMIC_SHAPE_ENGINES.popitem(last=False)
+        return result
 
 
 @unittest.skipIf(not torch.cuda.is_available(), "Skip because CUDA is not available")
@@ -65,66 +233,95 @@ class TRTTestCase(TestCase):
         check_dtype=True,
         pyt_inputs=None,
         rt_cls=PythonTorchTensorRTModule,
+        warmup_iters=1,
+        use_cuda_graph=False,
     ):
         with torch.no_grad():
-            cuda_inputs = []
-            for i in inputs:
-                cuda_inputs.append(i.cuda())
+            cuda_inputs = _to_device(inputs)
 
+            # Let the asynchronous input copies finish so they aren't counted
+            # as engine build time
+            torch.cuda.synchronize()
             start = time.perf_counter()
-            interpreter_result = interpreter.run()
+            with record_function("trt_harness.interpreter_run"):
+                interpreter_result = interpreter.run()
             sec = time.perf_counter() - start
             _LOGGER.info(f"Interpreter run time(s): {sec}")
-            trt_mod = rt_cls(
-                serialized_engine=interpreter_result.serialized_engine,
-                input_binding_names=list(interpreter_result.input_names),
-                output_binding_names=list(interpreter_result.output_names),
-                name="test_engine",
-            )
-            mod = mod.cuda()
-            if pyt_inputs is not None:
-                pyt_inputs_cuda = [
-                    i.cuda() if isinstance(i, torch.Tensor) else i for i in pyt_inputs
-                ]
-                ref_outputs = mod(*pyt_inputs_cuda)
-            else:
-                ref_outputs = mod(*cuda_inputs)
-
-            torch.cuda.synchronize()
-            start_event = torch.cuda.Event(enable_timing=True)
-            end_event = torch.cuda.Event(enable_timing=True)
-            start_event.record()
-            outputs = trt_mod(*cuda_inputs)
-            end_event.record()
-            torch.cuda.synchronize()
+            with record_function("trt_harness.engine_init"):
+                trt_mod = rt_cls(
+                    serialized_engine=interpreter_result.serialized_engine,
+                    input_binding_names=list(interpreter_result.input_names),
+                    output_binding_names=list(interpreter_result.output_names),
+                    name="test_engine",
+                )
+            if use_cuda_graph:
+                # The graph is recorded on the first call, which must stay untimed
+                warmup_iters = max(warmup_iters, 1)
+            with (
+                torch_tensorrt.runtime.enable_cudagraphs()
+                if use_cuda_graph
+                else nullcontext()
+            ):
+                # Untimed runs keep one-time engine setup costs out of the reported time
+                with record_function("trt_harness.warmup"):
+                    for _ in range(warmup_iters):
+                        trt_mod(*cuda_inputs)
+
+                # Events are ordered on the current stream, so only wait for the end
+                # event rather than for all work on the device
+                start_event = torch.cuda.Event(enable_timing=True)
+                end_event = torch.cuda.Event(enable_timing=True)
+                with record_function("trt_harness.trt_forward"):
+                    start_event.record()
+                    outputs = trt_mod(*cuda_inputs)
+                    end_event.record()
+                    end_event.synchronize()
             _LOGGER.info(
                 f"TRT run time(s)= {(start_event.elapsed_time(end_event) * 1.0e-3)}"
             )
 
-            if type(outputs) not in (list, tuple):
+            # The eager reference runs after the timed window so its kernels
+            # don't queue ahead of the TRT engine on the same stream
+            with record_function("trt_harness.eager_ref"):
+                mod = mod.cuda()
+                if pyt_inputs is not None:
+                    pyt_inputs_cuda = [
+                        i.cuda() if isinstance(i, torch.Tensor) else i
+                        for i in pyt_inputs
+                    ]
+                    ref_outputs = mod(*pyt_inputs_cuda)
+                else:
+                    ref_outputs = mod(*cuda_inputs)
+
+            if not isinstance(outputs, (list, tuple)):
                 outputs = [outputs]
-            if type(ref_outputs) not in (
-                list,
-                tuple,
-                torch.return_types.max,
-                torch.return_types.min,
-            ):
+            # Also covers structseq results such as torch.return_types.max
+            if not isinstance(ref_outputs, (list, tuple)):
                 ref_outputs = [ref_outputs]
-            for out, ref in zip(outputs, ref_outputs):
-                if not isinstance(ref, torch.Tensor):
-                    if len(out.shape) == 0:
-                        ref = torch.tensor(ref)
-                    else:
-                        ref = torch.tensor([ref])
-                ref = ref.cpu()  # to_dtype test has cases with gpu output
-                torch.testing.assert_close(
-                    out.cpu(),
-                    ref,
-                    rtol=rtol,
-                    atol=atol,
-                    equal_nan=True,
-                    check_dtype=check_dtype,
-                )
+            with record_function("trt_harness.assert_close"):
+                compared = []
+                for out, ref in zip(outputs, ref_outputs):
+                    if not isinstance(ref, torch.Tensor):
+                        if len(out.shape) == 0:
+                            ref = torch.tensor(ref)
+                        else:
+                            ref = torch.tensor([ref])
+                    compared.extend((out, ref))
+                # to_dtype test has cases with gpu reference output
+                compared = _to_host(compared)
+                outs, refs = compared[::2], compared[1::2]
+                # Outputs sharing one shape and dtype are compared in a single call
+                if len(outs) > 1 and _is_homogeneous(outs) and _is_homogeneous(refs):
+                    outs, refs = [torch.stack(outs)], [torch.stack(refs)]
+                for out, ref in zip(outs, refs):
+                    torch.testing.assert_close(
+                        out,
+                        ref,
+                        rtol=rtol,
+                        atol=atol,
+                        equal_nan=True,
+                        check_dtype=check_dtype,
+                    )
 
     def run_test_custom_compare_results(
         self,
@@ -149,9 +346,7 @@ class TRTTestCase(TestCase):
 
         """
         with torch.no_grad():
-            cuda_inputs = []
-            for i in inputs:
-                cuda_inputs.append(i.cuda())
+            cuda_inputs = _to_device(inputs)
 
             if len(expected_ops):
                 self.assert_has_op(mod, expected_ops)
@@ -163,8 +358,7 @@ class TRTTestCase(TestCase):
                 output_binding_names=list(interpreter_result.output_names),
                 name="test_engine",
             )
-            res_trt = trt_mod(*cuda_inputs).cpu()
-            res_cpu = mod(*cuda_inputs).cpu()
+            res_trt, res_cpu = _to_host([trt_mod(*cuda_inputs), mod(*cuda_inputs)])
             assert len(res_trt) == len(res_cpu)
             comparator = comparators
 
@@ -192,27 +386,13 @@ class TRTTestCase(TestCase):
                 interpreter.run(precision=torch.float)
 
     def assert_has_op(self, mod, ops):
-        ops_in_mod = set()
-
-        for node in mod.graph.nodes:
-            if node.op == "call_module":
-                ops_in_mod.add(type(fetch_attr(mod, node.target)))
-            elif node.op in {"call_function", "call_method"}:
-                ops_in_mod.add(node.target)
-
+        ops_in_mod = _ops_in_mod(mod)
         self.assertTrue(
             ops_in_mod >= ops, f"expected ops {ops}, actual ops {ops_in_mod}"
         )
 
     def assert_unexpected_op(self, mod, ops):
-        for node in mod.graph.nodes:
-            if node.op == "call_module":
-                if type(fetch_attr(mod, node.target)) in ops:
-                    return False
-            elif node.op in {"call_function", "call_method"}:
-                if node.target in ops:
-                    return False
-        return True
+        return _ops_in_mod(mod).isdisjoint(ops)
 
 
 class DispatchTestCase(TRTTestCase):
@@ -227,17 +407,22 @@ class DispatchTestCase(TRTTestCase):
         mod = mod.eval()
         torch_inputs = get_torch_inputs(original_inputs, _defaults.DEVICE)
         if use_dynamo_tracer:
-            exported_program = torch_tensorrt.dynamo.trace(mod, tuple(original_inputs))
-            exported_program = pre_export_lowering(exported_program)
-            exported_program = exported_program.run_decompositions(
-                get_decompositions(False)
-            )
-            fx_module = exported_program.module()
+            with record_function("trt_harness.dynamo_export"):
+                exported_program = torch_tensorrt.dynamo.trace(
+                    mod, tuple(original_inputs)
+                )
+                exported_program = pre_export_lowering(exported_program)
+                exported_program = exported_program.run_decompositions(
+                    get_decompositions(False)
+                )
+                fx_module = exported_program.module()
         else:
-            fx_module = torch.fx.symbolic_trace(mod)
+            with record_function("trt_harness.symbolic_trace"):
+                fx_module = torch.fx.symbolic_trace(mod)
 
         if enable_passes:
-            fx_module = post_lowering(fx_module)
+            with record_function("trt_harness.apply_lowering_passes"):
+                fx_module = post_lowering(fx_module)
 
         if propagate_shapes:
             # TODO: This is currently being used to test embedding_bag_aten due to https://github.com/pytorch/TensorRT/issues/2843
@@ -262,6 +447,8 @@ class DispatchTestCase(TRTTestCase):
         enable_passes=False,
         propagate_shapes=False,
         int32_reqd=False,
+        warmup_iters=1,
+        use_cuda_graph=False,
     ):
         mod = self.generate_graph(
             mod,
@@ -271,13 +458,7 @@ class DispatchTestCase(TRTTestCase):
             propagate_shapes=propagate_shapes,
         )
 
-        # Previous instance of the interpreter auto-casted 64-bit inputs
-        # We replicate this behavior here
-        compilation_settings = CompilationSettings(
-            enabled_precisions={dtype._from(precision)},
-            truncate_double=True,
-            debug=True,
-        )
+        compilation_settings = _compilation_settings(precision, debug=True)
 
         num_inputs = len(inputs)
         trt_inputs = inputs
@@ -333,6 +514,8 @@ class DispatchTestCase(TRTTestCase):
             atol,
             check_dtype,
             pyt_inputs=inputs,
+            warmup_iters=warmup_iters,
+            use_cuda_graph=use_cuda_graph,
         )
 
     def run_test_compare_tensor_attributes_only(
@@ -352,13 +535,7 @@ class DispatchTestCase(TRTTestCase):
             use_dynamo_tracer=use_dynamo_tracer,
             enable_passes=enable_passes,
         )
-        # Previous instance of the interpreter auto-casted 64-bit inputs
-        # We replicate this behavior here
-        compilation_settings = CompilationSettings(
-            enabled_precisions={dtype._from(precision)},
-            truncate_double=True,
-            debug=True,
-        )
+        compilation_settings = _compilation_settings(precision, debug=True)
 
         interp = TRTInterpreter(
             mod,
@@ -383,6 +560,8 @@ class DispatchTestCase(TRTTestCase):
         pyt_inputs=None,
         propagate_shapes=False,
         check_dtype=True,
+        warmup_iters=1,
+        use_cuda_graph=False,
     ):
         mod = self.generate_graph(
             mod,
@@ -392,9 +571,7 @@ class DispatchTestCase(TRTTestCase):
             propagate_shapes=propagate_shapes,
         )
 
-        # Previous instance of the interpreter auto-casted 64-bit inputs
-        # We replicate this behavior here
-        compilation_settings = CompilationSettings(truncate_double=True)
+        compilation_settings = _compilation_settings()
 
         if check_dtype:
             output_dtypes = infer_module_output_dtypes(
@@ -404,11 +581,15 @@ class DispatchTestCase(TRTTestCase):
                 truncate_double=compilation_settings.truncate_double,
             )
 
-        interp = TRTInterpreter(
-            mod,
-            input_specs,
-            output_dtypes=output_dtypes,
-            compilation_settings=compilation_settings,
+        interp = _CachedInterpreter(
+            functools.partial(
+                TRTInterpreter,
+                mod,
+                input_specs,
+                output_dtypes=output_dtypes,
+                compilation_settings=compilation_settings,
+            ),
+            (get_hash(mod, input_specs, compilation_settings), repr(output_dtypes)),
         )
         # Since the lowering is based on optimal shape. We need to test with
         # different shape(for ex. max shape) for testing dynamic shape
@@ -422,4 +603,13 @@ class DispatchTestCase(TRTTestCase):
         ]
         if not use_example_tensors:
             inputs_max = [spec.torch_tensor for spec in input_specs]
-        super().run_test(mod, inputs_max, interp, rtol, atol, pyt_inputs=pyt_inputs)
+        super().run_test(
+            mod,
+            inputs_max,
+            interp,
+            rtol,
+            atol,
+            pyt_inputs=pyt_inputs,
+            warmup_iters=warmup_iters,
+            use_cuda_graph=use_cuda_graph,
+        )
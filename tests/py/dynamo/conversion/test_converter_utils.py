@@ -1,12 +1,18 @@
 import numpy as np
+import tensorrt as trt
 import torch
 from parameterized import parameterized
 from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt.dynamo.conversion import ConversionContext
 from torch_tensorrt.dynamo.conversion.converter_utils import (
     enforce_tensor_types,
     flatten_dims,
+    get_module_tensor_ptrs,
+    get_trt_tensor,
+    to_numpy,
 )
 from torch_tensorrt.fx.types import TRTTensor
+from torch_tensorrt.logging import TRT_LOGGER
 
 from ..testing_utilities import DECIMALS_OF_AGREEMENT, lower_graph_testing
 
@@ -75,5 +81,50 @@ class TestFlattenDimsEnforcement(TestCase):
         self.assertEqual(new_shape, true_shape)
 
 
+class TestCreateConstantCaching(TestCase):
+    class TiedModule(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.fc1 = torch.nn.Linear(4, 4)
+            self.fc2 = torch.nn.Linear(4, 4)
+            self.fc2.weight = self.fc1.weight
+
+    def _context(self, module):
+        network = trt.Builder(TRT_LOGGER).create_network(
+            1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH)
+        )
+        return ConversionContext(
+            network, module_tensor_ptrs=get_module_tensor_ptrs(module)
+        )
+
+    def _num_constant_layers(self, ctx):
+        return sum(
+            ctx.net[i].type == trt.LayerType.CONSTANT for i in range(ctx.net.num_layers)
+        )
+
+    def test_tied_weight_single_constant(self):
+        module = self.TiedModule()
+        ctx = self._context(module)
+        get_trt_tensor(ctx, module.fc1.weight, "fc1_weight")
+        get_trt_tensor(ctx, module.fc2.weight, "fc2_weight")
+        self.assertEqual(self._num_constant_layers(ctx), 1)
+
+    def test_tied_weight_numpy_single_constant(self):
+        # get_attr hands CPU weights to converters as numpy views of the module tensor
+        module = self.TiedModule()
+        ctx = self._context(module)
+        get_trt_tensor(ctx, to_numpy(module.fc1.weight), "fc1_weight")
+        get_trt_tensor(ctx, to_numpy(module.fc2.weight), "fc2_weight")
+        self.assertEqual(self._num_constant_layers(ctx), 1)
+
+    def test_temporaries_not_cached(self):
+        module = self.TiedModule()
+        ctx = self._context(module)
+        get_trt_tensor(ctx, module.fc1.weight * 2, "scaled_weight_0")
+        get_trt_tensor(ctx, module.fc1.weight * 2, "scaled_weight_1")
+        self.assertEqual(self._num_constant_layers(ctx), 2)
+        self.assertEqual(len(ctx.constant_cache), 0)
+
+
 if __name__ == "__main__":
     run_tests()
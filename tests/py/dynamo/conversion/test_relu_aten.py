@@ -15,6 +15,14 @@ class TestReLUConverter(DispatchTestCase):
         inputs = [torch.randn(1, 10)]
         self.run_test(TestModule(), inputs)
 
+    def test_relu_with_cuda_graph(self):
+        class TestModule(nn.Module):
+            def forward(self, x):
+                return torch.ops.aten.relu.default(x)
+
+        inputs = [torch.randn(2, 10)]
+        self.run_test(TestModule(), inputs, use_cuda_graph=True)
+
     def test_relu_with_dynamic_shape(self):
         class TestModule(nn.Module):
             def forward(self, x):
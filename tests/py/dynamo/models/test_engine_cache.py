@@ -0,0 +1,123 @@
+# type: ignore
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pytest
+import torch
+import torch_tensorrt as torchtrt
+from torch.testing._internal.common_utils import TestCase
+from torch_tensorrt.dynamo._engine_cache import DiskEngineCache, get_hash
+from torch_tensorrt.dynamo._settings import CompilationSettings
+from torch_tensorrt.dynamo.utils import COSINE_THRESHOLD, cosine_similarity
+
+assertions = unittest.TestCase()
+
+
+class TestEngineCache(TestCase):
+    @pytest.mark.unit
+    def test_engine_cache_reuse(self):
+        class Model(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.conv = torch.nn.Conv2d(3, 8, 3)
+
+            def forward(self, x):
+                return torch.relu(self.conv(x))
+
+        model = Model().eval().cuda()
+        inputs = [torch.randn((1, 3, 32, 32)).cuda()]
+        exp_program = torch.export.export(model, tuple(inputs))
+
+        with tempfile.TemporaryDirectory() as engine_cache_dir:
+            compile_spec = {
+                "inputs": inputs,
+                "min_block_size": 1,
+                "engine_cache_dir": engine_cache_dir,
+            }
+            trt_gm = torchtrt.dynamo.compile(exp_program, **compile_spec)
+            cached_engines = [
+                f for f in os.listdir(engine_cache_dir) if f.endswith(".engine")
+            ]
+            assertions.assertEqual(
+                len(cached_engines),
+                1,
+                msg=f"Expected exactly one cached engine, found {cached_engines}",
+            )
+
+            # A warm compile must not rebuild the engine
+            with mock.patch(
+                "torch_tensorrt.dynamo.conversion._conversion.interpret_module_to_result",
+                side_effect=AssertionError("Engine was rebuilt despite a cache hit"),
+            ):
+                cached_trt_gm = torchtrt.dynamo.compile(exp_program, **compile_spec)
+
+            cos_sim = cosine_similarity(trt_gm(*inputs), cached_trt_gm(*inputs))
+            assertions.assertTrue(
+                cos_sim > COSINE_THRESHOLD,
+                msg=f"Cached engine outputs don't match the original engine. Cosine sim score: {cos_sim} Threshold: {COSINE_THRESHOLD}",
+            )
+
+        # Clean up model env
+        torch._dynamo.reset()
+
+
+class TestDiskEngineCache(TestCase):
+    @pytest.mark.unit
+    def test_save_load_roundtrip(self):
+        entry = (
+            b"engine bytes",
+            ["x"],
+            ["output0"],
+            {"[CONV]-[conv] KERNEL": ["conv.weight", np.dtype("float32")]},
+            (
+                (
+                    "ShapeMode.STATIC",
+                    "(1, 3)",
+                    "dtype.f32",
+                    "TensorFormat.contiguous",
+                    False,
+                ),
+            ),
+        )
+        with tempfile.TemporaryDirectory() as engine_cache_dir:
+            cache = DiskEngineCache(engine_cache_dir, 1 << 20)
+            cache.save("abc", entry)
+            assertions.assertEqual(cache.load("abc"), entry)
+            assertions.assertIsNone(cache.load("missing"))
+
+    @pytest.mark.unit
+    def test_corrupt_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as engine_cache_dir:
+            cache = DiskEngineCache(engine_cache_dir, 1 << 20)
+            cache.save("abc", (b"engine bytes", ["x"], ["output0"], None, ()))
+            with open(os.path.join(engine_cache_dir, "abc.json"), "w") as f:
+                f.write('{"input_names": ')
+            assertions.assertIsNone(cache.load("abc"))
+
+    @pytest.mark.unit
+    def test_failed_save_does_not_raise(self):
+        with tempfile.NamedTemporaryFile() as not_a_dir:
+            cache = DiskEngineCache(not_a_dir.name, 1 << 20)
+            cache.save("abc", (b"engine bytes", ["x"], ["output0"], None, ()))
+            assertions.assertIsNone(cache.load("abc"))
+
+    @pytest.mark.unit
+    def test_hash_covers_submodule_configuration(self):
+        class Model(torch.nn.Module):
+            def __init__(self, dim):
+                super().__init__()
+                self.softmax = torch.nn.Softmax(dim=dim)
+
+            def forward(self, x):
+                return self.softmax(x)
+
+        inputs = [torchtrt.Input((1, 3, 8))]
+        settings = CompilationSettings()
+        hashes = [
+            get_hash(torch.fx.symbolic_trace(Model(dim)), inputs, settings)
+            for dim in (1, 2)
+        ]
+        assertions.assertNotEqual(hashes[0], hashes[1])
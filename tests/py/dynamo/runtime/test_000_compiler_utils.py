@@ -1,12 +1,16 @@
 import unittest
 
+import numpy as np
+import tensorrt as trt
 import torch
 import torch_tensorrt
 from torch_tensorrt.dynamo.utils import (
+    check_output_equal,
     prepare_inputs,
     to_torch_device,
     to_torch_tensorrt_device,
 )
+from torch_tensorrt.fx.utils import Frameworks, unified_dtype_converter
 
 from ..testing_utilities import same_output_format
 
@@ -89,5 +93,52 @@ class TestPrepareInputs(unittest.TestCase):
         )
 
 
+class TestCheckOutputEqual(unittest.TestCase):
+    def test_identical_tensor(self):
+        output = torch.rand((4, 4))
+        self.assertTrue(check_output_equal(output, output))
+
+    def test_mismatch_after_first_element(self):
+        first = torch.ones((4, 4))
+        self.assertFalse(
+            check_output_equal(
+                [first, torch.zeros((2, 2))], [first.clone(), torch.ones((2, 2))]
+            )
+        )
+
+    def test_exact_match(self):
+        output = torch.rand((4, 4))
+        self.assertTrue(check_output_equal(output, output.clone(), rtol=0, atol=0))
+        self.assertFalse(check_output_equal(output, output + 1e-4, rtol=0, atol=0))
+
+
+class TestUnifiedDtypeConverter(unittest.TestCase):
+    def test_convert_between_frameworks(self):
+        self.assertEqual(
+            unified_dtype_converter(torch.float16, Frameworks.TRT), trt.float16
+        )
+        self.assertEqual(
+            unified_dtype_converter(trt.int32, Frameworks.TORCH), torch.int32
+        )
+        self.assertEqual(unified_dtype_converter(np.int64, Frameworks.TRT), trt.int64)
+
+    def test_numpy_dtype_instance(self):
+        self.assertEqual(
+            unified_dtype_converter(np.dtype("float32"), Frameworks.TORCH),
+            torch.float32,
+        )
+        self.assertEqual(
+            unified_dtype_converter(np.dtype(bool), Frameworks.TRT), trt.bool
+        )
+
+    def test_python_bool(self):
+        self.assertEqual(unified_dtype_converter(bool, Frameworks.TORCH), torch.bool)
+        self.assertEqual(unified_dtype_converter(bool, Frameworks.NUMPY), np.bool_)
+
+    def test_unsupported_dtype(self):
+        with self.assertRaises(TypeError):
+            unified_dtype_converter(torch.complex64, Frameworks.TRT)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import torch
 import torch_tensorrt
 from torch.testing._internal.common_utils import TestCase, run_tests
+from torch_tensorrt.dynamo.runtime._TorchGpuAllocator import TorchGpuAllocator
 
 
 class TestLowRankInputs(TestCase):
@@ -77,5 +78,24 @@ class TestLowRankInputs(TestCase):
         torch._dynamo.reset()
 
 
+class TestTorchGpuAllocator(TestCase):
+    def test_default_alignment(self):
+        allocator = TorchGpuAllocator()
+        ptr = allocator.allocate(1000, 256, 0)
+        self.assertNotEqual(ptr, 0)
+        self.assertEqual(ptr % 256, 0)
+        self.assertTrue(allocator.deallocate(ptr))
+
+    def test_stricter_alignment(self):
+        allocator = TorchGpuAllocator()
+        for alignment in (512, 4096):
+            with self.subTest(alignment=alignment):
+                ptr = allocator.allocate(1000, alignment, 0)
+                self.assertNotEqual(ptr, 0)
+                self.assertEqual(ptr % alignment, 0)
+                self.assertTrue(allocator.deallocate(ptr))
+                self.assertEqual(len(allocator._unaligned), 0)
+
+
 if __name__ == "__main__":
     run_tests()